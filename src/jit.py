@@ -0,0 +1,35 @@
+"""
+Optionale Numba-Unterstützung für Audio Visualizer Pro.
+
+Numba ist keine harte Abhängigkeit (wird aber von librosa mitinstalliert).
+Ist es nicht verfügbar, liefert ``njit`` die Funktion unverändert zurück und
+``prange`` entspricht ``range``. Aufrufer prüfen ``NUMBA_AVAILABLE`` und
+nutzen dann ihren NumPy-Pfad statt der (langsamen) reinen Python-Schleifen.
+"""
+
+from .logger import get_logger
+
+logger = get_logger("audio_visualizer.jit")
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    logger.debug("numba nicht installiert - nutze NumPy-Fallbacks")
+
+    def njit(*args, **kwargs):
+        """Ersatz für numba.njit: gibt die Funktion unverändert zurück."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+    prange = range
+
+
+__all__ = ["NUMBA_AVAILABLE", "njit", "prange"]
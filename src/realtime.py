@@ -8,15 +8,15 @@ Features:
 """
 
 import numpy as np
+import scipy.fft as spfft
 import threading
-import queue
 import time
 from dataclasses import dataclass
 from typing import Callable, Optional, List, Dict, Any
-from collections import deque
 
 import streamlit as st
 
+from .jit import NUMBA_AVAILABLE, njit, prange
 from .logger import get_logger
 from .types import AudioFeatures
 from .visuals.registry import VisualizerRegistry
@@ -49,6 +49,66 @@ class RealtimeConfig:
     # FFT
     fft_size: int = 2048
     freq_bands: int = 64  # Anzahl der Frequenz-Bänder für Visualisierung
+    # Band-Aggregation auf mehrere Threads verteilen (Numba prange).
+    # Lohnt erst bei vielen Bändern / großer FFT, sonst dominiert der Thread-Overhead.
+    parallel_bands: bool = False
+
+
+class AudioRingBuffer:
+    """
+    Lock-freier Single-Producer/Single-Consumer Ring-Buffer für Audio-Blöcke.
+
+    Der Audio-Thread schreibt (``put``), genau ein Consumer liest (``get``).
+    Es gibt keine Locks und keine Allokationen auf der Producer-Seite:
+    ``_head`` schreibt nur der Producer, ``_tail`` nur der Consumer, und
+    Python-Int-Zuweisungen sind unter dem GIL atomar. Ist der Ring voll,
+    überholt der Producer den Consumer und der älteste Block gilt als
+    verworfen. Der Consumer prüft nach dem Kopieren, ob der Slot inzwischen
+    überschrieben wurde.
+    """
+
+    def __init__(self, capacity: int, block_size: int, channels: int):
+        self.capacity = capacity
+        # Ein Reserve-Slot für den Block, den der Producer gerade schreibt
+        self._n_slots = capacity + 1
+        self._slots = np.zeros(
+            (self._n_slots, block_size, channels), dtype=np.float32
+        )
+        self._frames = [0] * self._n_slots
+        self._head = 0  # Anzahl geschriebener Blöcke (nur Producer)
+        self._tail = 0  # Anzahl gelesener Blöcke (nur Consumer)
+
+    def put(self, block: np.ndarray) -> None:
+        """Kopiert einen Block in den nächsten Slot (Producer-Seite)."""
+        head = self._head
+        slot = head % self._n_slots
+        n = min(len(block), self._slots.shape[1])
+        np.copyto(self._slots[slot, :n], block[:n])
+        self._frames[slot] = n
+        self._head = head + 1
+
+    def get(self, timeout: float = 0.1) -> Optional[np.ndarray]:
+        """Holt den ältesten Block als Kopie oder None nach ``timeout`` Sekunden."""
+        deadline = time.monotonic() + timeout
+        while True:
+            # Vom Producer überholte Blöcke sind verworfen
+            tail = max(self._tail, self._head - self.capacity)
+            if self._head > tail:
+                slot = tail % self._n_slots
+                block = self._slots[slot, : self._frames[slot]].copy()
+                # Slot wird erst beim Schreiben von Block tail + n_slots wiederverwendet
+                if self._head - self.capacity <= tail:
+                    self._tail = tail + 1
+                    return block
+                continue
+
+            if time.monotonic() >= deadline:
+                return None
+            time.sleep(0.001)
+
+    def __len__(self) -> int:
+        head = self._head
+        return head - max(self._tail, head - self.capacity)
 
 
 class RealtimeAudioCapture:
@@ -68,7 +128,13 @@ class RealtimeAudioCapture:
         self._callback: Optional[Callable] = None
         self._stream = None
         self._thread: Optional[threading.Thread] = None
-        self._audio_queue: queue.Queue = queue.Queue(maxsize=10)
+
+        # Lock-freier Ring zwischen Audio-Thread und Consumer
+        self._audio_ring = AudioRingBuffer(
+            capacity=10,
+            block_size=self.config.block_size,
+            channels=self.config.channels,
+        )
 
         if not SOUNDDEVICE_AVAILABLE:
             raise RuntimeError(
@@ -76,24 +142,22 @@ class RealtimeAudioCapture:
             )
 
     def _audio_callback(self, indata, frames, time_info, status):
-        """Callback für sounddevice."""
+        """
+        Callback für sounddevice (läuft im Echtzeit-Audio-Thread).
+
+        Alloziert nichts und nimmt keine Locks: ``indata`` wird in den
+        Ring-Buffer kopiert. Der optionale Callback erhält ``indata`` als View,
+        die nur während des Aufrufs gültig ist - wer die Daten behalten will,
+        kopiert selbst.
+        """
         if status:
             logger.warning(f"Audio Status: {status}")
 
-        # Audio-Daten in Queue (non-blocking)
-        try:
-            self._audio_queue.put_nowait(indata.copy())
-        except queue.Full:
-            # Alte Daten verwerfen wenn Queue voll
-            try:
-                self._audio_queue.get_nowait()
-                self._audio_queue.put_nowait(indata.copy())
-            except queue.Empty:
-                pass
+        self._audio_ring.put(indata)
 
         # Callback aufrufen
         if self._callback:
-            self._callback(indata.copy())
+            self._callback(indata)
 
     def start(self, callback: Optional[Callable] = None):
         """Startet die Audio-Erfassung."""
@@ -109,6 +173,7 @@ class RealtimeAudioCapture:
                 blocksize=self.config.block_size,
                 channels=self.config.channels,
                 device=self.config.device,
+                dtype="float32",
                 callback=self._audio_callback,
             )
             self._stream.start()
@@ -131,11 +196,8 @@ class RealtimeAudioCapture:
         logger.info("Real-Time Audio gestoppt")
 
     def get_audio_block(self, timeout: float = 0.1) -> Optional[np.ndarray]:
-        """Holt einen Audio-Block aus der Queue."""
-        try:
-            return self._audio_queue.get(timeout=timeout)
-        except queue.Empty:
-            return None
+        """Holt einen Audio-Block aus dem Ring-Buffer (als Kopie)."""
+        return self._audio_ring.get(timeout=timeout)
 
     def is_running(self) -> bool:
         """Prüft ob die Erfassung läuft."""
@@ -161,6 +223,106 @@ class RealtimeAudioCapture:
         return devices
 
 
+@njit(cache=True, fastmath=True)
+def _prepare_block_kernel(audio, window, padded_out, windowed_out):
+    """
+    Fusionierter Vor-FFT-Pass: RMS, Zero-Padding und Fensterung.
+
+    Returns:
+        RMS des (ungepaddeten) Blocks
+    """
+    n_audio = audio.shape[0]
+    n_fft = padded_out.shape[0]
+    n = min(n_audio, n_fft)
+
+    acc = 0.0
+    for k in range(n_audio):
+        acc += audio[k] * audio[k]
+
+    for k in range(n):
+        padded_out[k] = audio[k]
+        windowed_out[k] = audio[k] * window[k]
+    for k in range(n, n_fft):
+        padded_out[k] = 0.0
+        windowed_out[k] = 0.0
+
+    return np.sqrt(acc / n_audio)
+
+
+@njit(cache=True, fastmath=True)
+def _spectral_kernel(magnitude, freqs, prev_spectrum, spectrum_out):
+    """
+    Fusionierter Nach-FFT-Pass über das Magnitude-Spektrum.
+
+    Berechnet Spectral Centroid, das max-normalisierte Spektrum (in
+    ``spectrum_out``) und den positiven Spectral Flux gegenüber
+    ``prev_spectrum``.
+
+    Returns:
+        (centroid in Hz, spectral flux)
+    """
+    n_bins = magnitude.shape[0]
+    weighted = 0.0
+    total = 0.0
+    max_mag = 0.0
+    for k in range(n_bins):
+        m = magnitude[k]
+        weighted += freqs[k] * m
+        total += m
+        if m > max_mag:
+            max_mag = m
+
+    inv = 1.0 / (max_mag + 1e-8)
+    flux = 0.0
+    for k in range(n_bins):
+        v = magnitude[k] * inv
+        d = v - prev_spectrum[k]
+        if d > 0:
+            flux += d
+        spectrum_out[k] = v
+
+    centroid = weighted / total if total > 0 else 0.0
+    return centroid, flux
+
+
+@njit(cache=True, fastmath=True)
+def _normalize_bands(bands_out):
+    """Normalisiert die Bänder in-place auf ihr Maximum."""
+    band_max = 0.0
+    for i in range(bands_out.shape[0]):
+        if bands_out[i] > band_max:
+            band_max = bands_out[i]
+    if band_max > 0:
+        for i in range(bands_out.shape[0]):
+            bands_out[i] /= band_max
+
+
+@njit(cache=True, fastmath=True)
+def _bands_kernel(magnitude, edge_idx, bands_out):
+    """Mittelwert pro logarithmischem Band, anschließend normalisiert."""
+    for i in range(bands_out.shape[0]):
+        lo = edge_idx[i]
+        hi = edge_idx[i + 1]
+        acc = 0.0
+        for k in range(lo, hi):
+            acc += magnitude[k]
+        bands_out[i] = acc / (hi - lo) if hi > lo else 0.0
+    _normalize_bands(bands_out)
+
+
+@njit(parallel=True, cache=True, fastmath=True)
+def _bands_kernel_parallel(magnitude, edge_idx, bands_out):
+    """Wie ``_bands_kernel``, die Bänder werden aber per prange verteilt."""
+    for i in prange(bands_out.shape[0]):
+        lo = edge_idx[i]
+        hi = edge_idx[i + 1]
+        acc = 0.0
+        for k in range(lo, hi):
+            acc += magnitude[k]
+        bands_out[i] = acc / (hi - lo) if hi > lo else 0.0
+    _normalize_bands(bands_out)
+
+
 class RealtimeFeatureExtractor:
     """
     Extrahiert Audio-Features in Echtzeit für Visualisierung.
@@ -175,12 +337,36 @@ class RealtimeFeatureExtractor:
     def __init__(self, config: Optional[RealtimeConfig] = None):
         self.config = config or RealtimeConfig()
 
-        # History für Smoothing
-        self._rms_history = deque(maxlen=10)
-        self._spectrum_history = deque(maxlen=5)
+        # History für Smoothing: RMS als Ring-Buffer mit laufender Summe
+        self._rms_ring = np.zeros(10, dtype=np.float32)
+        self._rms_head = 0
+        self._rms_count = 0
+        self._rms_sum = 0.0
+
+        # FFT Setup (durchgehend float32: halbe Bandbreite, doppelte SIMD-Breite)
+        fft_size = self.config.fft_size
+        self._fft_window = np.hanning(fft_size).astype(np.float32)
+        self._windowed = np.empty(fft_size, dtype=np.float32)
+        self._audio_padded = np.zeros(fft_size, dtype=np.float32)
+
+        # Frequenz-Raster und logarithmische Band-Grenzen (20Hz - Nyquist)
+        # hängen nur von der Config ab und werden einmalig berechnet
+        self._freqs = np.fft.rfftfreq(fft_size, 1 / self.config.sample_rate).astype(
+            np.float32
+        )
+        self._band_edges = np.logspace(
+            np.log10(20), np.log10(self.config.sample_rate / 2), self.config.freq_bands + 1
+        )
+        self._edge_idx = np.searchsorted(self._freqs, self._band_edges)
+        self._band_widths = np.diff(self._edge_idx)
+        self._bands_out = np.zeros(self.config.freq_bands, dtype=np.float32)
+        # Magnitude + eine Null am Ende, damit np.add.reduceat das letzte Band begrenzt
+        self._magnitude_padded = np.zeros(len(self._freqs) + 1, dtype=np.float32)
 
-        # FFT Setup
-        self._fft_window = np.hanning(self.config.fft_size)
+        # Spektrum-History als 2D Ring-Buffer (history_len, n_bins)
+        self._spec_ring = np.zeros((5, len(self._freqs)), dtype=np.float32)
+        self._spec_head = 0
+        self._spec_count = 0
 
         # Beat Detection
         self._beat_threshold = 0.5
@@ -201,44 +387,55 @@ class RealtimeFeatureExtractor:
         if audio_block.ndim > 1:
             audio = audio_block.mean(axis=1)
         else:
-            audio = audio_block.flatten()
+            audio = audio_block.ravel()
 
-        # RMS (Lautstärke)
-        rms = np.sqrt(np.mean(audio**2))
-        self._rms_history.append(rms)
-        rms_smooth = np.mean(self._rms_history) if self._rms_history else rms
-
-        # Zero-padding für FFT falls nötig
-        if len(audio) < self.config.fft_size:
-            audio_padded = np.zeros(self.config.fft_size)
-            audio_padded[: len(audio)] = audio
+        # RMS (Lautstärke), Zero-Padding und Fensterung
+        if NUMBA_AVAILABLE:
+            rms = _prepare_block_kernel(
+                audio, self._fft_window, self._audio_padded, self._windowed
+            )
         else:
-            audio_padded = audio[: self.config.fft_size]
+            rms = np.sqrt(np.mean(audio**2))
+            n = min(len(audio), self.config.fft_size)
+            self._audio_padded[:n] = audio[:n]
+            self._audio_padded[n:] = 0.0
+            np.multiply(self._audio_padded, self._fft_window, out=self._windowed)
 
-        # FFT
-        windowed = audio_padded * self._fft_window[: len(audio_padded)]
-        fft = np.fft.rfft(windowed, n=self.config.fft_size)
-        magnitude = np.abs(fft)
+        rms_smooth = self._smooth_rms(rms)
 
-        # Frequenz-Bänder (logarithmisch)
-        freqs = np.fft.rfftfreq(self.config.fft_size, 1 / self.config.sample_rate)
-        bands = self._compute_freq_bands(magnitude, freqs)
+        # FFT (scipy.fft cached die Plans, float32 -> complex64; _windowed darf
+        # überschrieben werden)
+        fft = spfft.rfft(self._windowed, n=self.config.fft_size, overwrite_x=True)
+        magnitude = np.abs(fft)
 
-        # Spectral Centroid
-        centroid = self._compute_centroid(magnitude, freqs)
+        # Centroid, Frequenz-Bänder (logarithmisch) und Spectral Flux.
+        # Das normalisierte Spektrum wird direkt in den Ring-Slot geschrieben.
+        history_len = self._spec_ring.shape[0]
+        spectrum_norm = self._spec_ring[self._spec_head]
+        prev_spectrum = self._spec_ring[(self._spec_head - 1) % history_len]
+        if NUMBA_AVAILABLE:
+            centroid, flux = _spectral_kernel(
+                magnitude, self._freqs, prev_spectrum, spectrum_norm
+            )
+            bands_kernel = (
+                _bands_kernel_parallel if self.config.parallel_bands else _bands_kernel
+            )
+            bands_kernel(magnitude, self._edge_idx, self._bands_out)
+            bands = self._bands_out.copy()
+        else:
+            bands = self._compute_freq_bands(magnitude, self._freqs)
+            centroid = self._compute_centroid(magnitude, self._freqs)
+            np.divide(magnitude, np.max(magnitude) + 1e-8, out=spectrum_norm)
+            flux = np.maximum(spectrum_norm - prev_spectrum, 0).sum()
 
         # Onset Detection (einfache Spectral Flux)
-        spectrum_norm = magnitude / (np.max(magnitude) + 1e-8)
-        self._spectrum_history.append(spectrum_norm)
-
         onset = 0.0
-        if len(self._spectrum_history) >= 2:
-            diff = spectrum_norm - self._spectrum_history[-2]
-            onset = np.maximum(diff, 0).sum()
-
+        if self._spec_count > 0:
             # Exponential smoothing
-            self._onset_envelope = (0.8 * self._onset_envelope) + (0.2 * onset)
+            self._onset_envelope = (0.8 * self._onset_envelope) + (0.2 * flux)
             onset = self._onset_envelope
+        self._spec_head = (self._spec_head + 1) % history_len
+        self._spec_count = min(self._spec_count + 1, history_len)
 
         # Beat Detection
         beat = self._detect_beat(rms_smooth, onset)
@@ -249,34 +446,57 @@ class RealtimeFeatureExtractor:
             "centroid": float(centroid / (self.config.sample_rate / 2)),  # Normalisiert
             "onset": float(np.clip(onset, 0, 1)),
             "beat": beat,
-            "raw_audio": audio_padded,
+            "raw_audio": self._audio_padded.copy(),
         }
 
+    def _smooth_rms(self, rms: float) -> float:
+        """Gleitender Mittelwert über die letzten 10 RMS-Werte in O(1)."""
+        size = len(self._rms_ring)
+        head = self._rms_head
+
+        self._rms_sum += rms - self._rms_ring[head]
+        self._rms_ring[head] = rms
+        self._rms_head = (head + 1) % size
+        self._rms_count = min(self._rms_count + 1, size)
+
+        # Einmal pro Umlauf exakt nachsummieren, damit sich keine Rundungsfehler aufbauen
+        if self._rms_head == 0:
+            self._rms_sum = float(self._rms_ring.sum())
+
+        return self._rms_sum / self._rms_count
+
     def _compute_freq_bands(
         self, magnitude: np.ndarray, freqs: np.ndarray
     ) -> np.ndarray:
-        """Berechnet logarithmische Frequenz-Bänder."""
-        # Logarithmische Band-Grenzen (20Hz - Nyquist)
-        f_min = 20
-        f_max = self.config.sample_rate / 2
+        """
+        Berechnet logarithmische Frequenz-Bänder (NumPy-Pfad ohne Numba).
 
-        band_edges = np.logspace(
-            np.log10(f_min), np.log10(f_max), self.config.freq_bands + 1
-        )
+        Die Band-Summen kommen aus einem einzigen ``np.add.reduceat``-Aufruf.
+        Für das eigene Frequenz-Raster werden die vorberechneten Band-Indizes
+        genutzt, für abweichende ``freqs`` werden sie neu bestimmt.
+        """
+        if freqs is self._freqs:
+            edge_idx = self._edge_idx
+            widths = self._band_widths
+            padded = self._magnitude_padded
+            padded[:-1] = magnitude
+        else:
+            edge_idx = np.searchsorted(freqs, self._band_edges)
+            widths = np.diff(edge_idx)
+            padded = np.append(magnitude, 0.0)
 
-        bands = np.zeros(self.config.freq_bands)
+        sums = np.add.reduceat(padded, edge_idx)[:-1]
 
-        for i in range(self.config.freq_bands):
-            mask = (freqs >= band_edges[i]) & (freqs < band_edges[i + 1])
-            if mask.any():
-                bands[i] = np.mean(magnitude[mask])
+        # Leere Bänder bleiben 0 (reduceat liefert dort den Einzelwert)
+        bands = self._bands_out
+        bands.fill(0.0)
+        np.divide(sums, widths, out=bands, where=widths > 0, casting="unsafe")
 
-        # Normalisieren
+        # Normalisieren (Rückgabe als neues Array, da es an den Render-Thread geht)
         max_val = np.max(bands)
         if max_val > 0:
-            bands = bands / max_val
-
-        return bands
+            return bands / max_val
+        return bands.copy()
 
     def _compute_centroid(self, magnitude: np.ndarray, freqs: np.ndarray) -> float:
         """Berechnet Spectral Centroid."""
@@ -434,23 +654,24 @@ class RealtimeVisualizer:
             return None
 
     def _update_visualizer_features(self, features: Dict):
-        """Updated die Features des Visualizers."""
-        # Erstelle temporäre Arrays für den Visualizer
-        fps = self.config.fps
+        """
+        Updated die Features des Visualizers.
+
+        Schreibt in-place in die einmalig angelegten Arrays der Dummy-Features
+        (Views auf deren float32-Buffer) statt pro Frame neue Arrays zu bauen.
+        """
+        viz_features = self._visualizer.features
 
         # Aktualisiere RMS (Lautstärke)
-        rms_array = np.ones(fps) * features["rms"]
-        self._visualizer.features.rms = rms_array
+        viz_features.rms.fill(features["rms"])
 
         # Aktualisiere Onset (Beats)
-        onset_array = np.zeros(fps)
+        viz_features.onset.fill(0.0)
         if features["beat"]:
-            onset_array[0] = 1.0  # Trigger beat
-        self._visualizer.features.onset = onset_array
+            viz_features.onset[0] = 1.0  # Trigger beat
 
         # Aktualisiere Spectral Centroid
-        centroid_array = np.ones(fps) * features["centroid"]
-        self._visualizer.features.spectral_centroid = centroid_array
+        viz_features.spectral_centroid.fill(features["centroid"])
 
         # Für Spectrum Bars Visualizer: direkte Spectrum-Daten
         if hasattr(self._visualizer, "_last_spectrum"):
@@ -3,10 +3,27 @@ Type Definitions für das Audio Visualizer Pro System.
 Pydantic Models für alle Konfigurationen und Audio-Features.
 """
 
-from pydantic import BaseModel, Field, ConfigDict, field_validator
+from pydantic import (
+    BaseModel,
+    Field,
+    ConfigDict,
+    PrivateAttr,
+    field_validator,
+    model_validator,
+)
 from typing import Literal, Dict, Optional, Tuple
 import numpy as np
 
+# Frame-Features, die in gemeinsamen float32-Buffern liegen (SoA-Layout)
+SCALAR_FEATURES = (
+    "rms",
+    "onset",
+    "spectral_centroid",
+    "spectral_rolloff",
+    "zero_crossing_rate",
+)
+MATRIX_FEATURES = ("chroma", "mfcc", "tempogram")
+
 
 class AudioFeatures(BaseModel):
     """Schema für alle Audio-Features. Einheitlich für alle Renderer."""
@@ -41,6 +58,50 @@ class AudioFeatures(BaseModel):
     key: Optional[str] = None  # "C major", "A minor" etc.
     mode: Literal["music", "speech", "hybrid"]
 
+    # Gemeinsame Backing-Buffer: (5, frames) bzw. (12+13+384, frames), float32
+    _scalars: Optional[np.ndarray] = PrivateAttr(default=None)
+    _matrices: Optional[np.ndarray] = PrivateAttr(default=None)
+
+    @model_validator(mode="after")
+    def _pack_buffers(self) -> "AudioFeatures":
+        """
+        Packt die Frame-Features in zwei zusammenhängende float32-Buffer.
+
+        Die Felder (``rms``, ``chroma``, ...) bleiben normale Arrays, sind aber
+        Views auf die gemeinsamen Buffer. Haben die Arrays unterschiedliche
+        Frame-Anzahlen, bleibt die jeweilige Gruppe ungepackt.
+        """
+        self._scalars = self._pack(SCALAR_FEATURES, ndim=1)
+        self._matrices = self._pack(MATRIX_FEATURES, ndim=2)
+        return self
+
+    def _pack(self, names: Tuple[str, ...], ndim: int) -> Optional[np.ndarray]:
+        """Kopiert die Arrays ``names`` in einen Buffer und ersetzt sie durch Views."""
+        arrays = [np.asarray(getattr(self, name)) for name in names]
+        if any(a.ndim != ndim for a in arrays) or len({a.shape[-1] for a in arrays}) != 1:
+            return None
+
+        rows = [1 if ndim == 1 else a.shape[0] for a in arrays]
+        buffer = np.empty((sum(rows), arrays[0].shape[-1]), dtype=np.float32)
+
+        start = 0
+        for name, array, n_rows in zip(names, arrays, rows):
+            view = buffer[start] if ndim == 1 else buffer[start : start + n_rows]
+            view[...] = array
+            setattr(self, name, view)
+            start += n_rows
+        return buffer
+
+    @property
+    def scalar_buffer(self) -> Optional[np.ndarray]:
+        """Buffer (5, frames) hinter rms/onset/centroid/rolloff/zcr (oder None)."""
+        return self._scalars
+
+    @property
+    def matrix_buffer(self) -> Optional[np.ndarray]:
+        """Buffer (rows, frames) hinter chroma/mfcc/tempogram (oder None)."""
+        return self._matrices
+
 
 class VisualConfig(BaseModel):
     """Jeder Visualizer hat diese Konfiguration."""
@@ -161,5 +161,20 @@ def test_interpolate_method(analyzer):
     assert interpolated[-1] == 100
 
 
+
+def test_features_packed_float32_buffers(analyzer, test_audio_file):
+    """Testet dass Frame-Features als float32-Views auf gemeinsamen Buffern liegen."""
+    for _ in range(2):  # Analyse + Cache-Load
+        features = analyzer.analyze(test_audio_file, fps=30)
+
+        assert features.scalar_buffer.dtype == np.float32
+        assert features.scalar_buffer.shape == (5, len(features.rms))
+        assert np.shares_memory(features.rms, features.scalar_buffer)
+        assert np.shares_memory(features.zero_crossing_rate, features.scalar_buffer)
+
+        assert features.matrix_buffer.shape[0] == 12 + 13 + 384
+        assert np.shares_memory(features.chroma, features.matrix_buffer)
+        assert features.chroma.shape == (12, len(features.rms))
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
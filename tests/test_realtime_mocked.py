@@ -38,6 +38,40 @@ class TestRealtimeAudioCaptureMocked:
         
         assert devices == []
 
+    def test_audio_callback_roundtrip(self):
+        """Test dass Blöcke aus dem Callback unverändert abgeholt werden."""
+        from src.realtime import RealtimeAudioCapture, RealtimeConfig
+
+        with patch('src.realtime.SOUNDDEVICE_AVAILABLE', True):
+            capture = RealtimeAudioCapture(RealtimeConfig(block_size=256))
+
+        received = []
+        capture._callback = lambda block: received.append(block.sum())
+
+        indata = np.random.rand(256, 1).astype(np.float32)
+        capture._audio_callback(indata, 256, None, None)
+
+        block = capture.get_audio_block(timeout=0.01)
+        assert np.array_equal(block, indata)
+        assert received == [indata.sum()]
+        assert capture.get_audio_block(timeout=0.01) is None
+
+    def test_audio_callback_drops_oldest_when_full(self):
+        """Test dass bei voller Queue der älteste Block verworfen wird."""
+        from src.realtime import RealtimeAudioCapture, RealtimeConfig
+
+        with patch('src.realtime.SOUNDDEVICE_AVAILABLE', True):
+            capture = RealtimeAudioCapture(RealtimeConfig(block_size=4))
+
+        for i in range(15):
+            capture._audio_callback(np.full((4, 1), i, dtype=np.float32), 4, None, None)
+
+        values = []
+        while (block := capture.get_audio_block(timeout=0.01)) is not None:
+            values.append(int(block[0, 0]))
+
+        assert values == list(range(5, 15))
+
 
 # =============================================================================
 # RealtimeFeatureExtractor Tests
@@ -169,6 +203,42 @@ class TestRealtimeFeatureExtractor:
         # Bei gleichem Input sollte RMS ähnlich sein
         assert abs(rms1 - rms2) < 0.1
 
+    def test_numba_and_numpy_paths_match(self):
+        """Test dass JIT-Kernel und NumPy-Fallback gleiche Features liefern."""
+        from src.realtime import RealtimeFeatureExtractor, RealtimeConfig
+
+        config = RealtimeConfig(sample_rate=44100, block_size=1024)
+        jit_extractor = RealtimeFeatureExtractor(config)
+        numpy_extractor = RealtimeFeatureExtractor(config)
+
+        rng = np.random.default_rng(0)
+        for _ in range(3):
+            audio = rng.standard_normal((1024, 1)).astype(np.float32) * 0.2
+            jit_features = jit_extractor.process(audio)
+            with patch('src.realtime.NUMBA_AVAILABLE', False):
+                numpy_features = numpy_extractor.process(audio)
+
+            for key in ['rms', 'centroid', 'onset']:
+                assert jit_features[key] == pytest.approx(numpy_features[key], abs=1e-4)
+            np.testing.assert_allclose(
+                jit_features['spectrum'], numpy_features['spectrum'], atol=1e-4
+            )
+
+    def test_parallel_bands_match_serial(self):
+        """Test dass parallele Band-Aggregation dasselbe Spektrum liefert."""
+        from src.realtime import RealtimeFeatureExtractor, RealtimeConfig
+
+        serial = RealtimeFeatureExtractor(RealtimeConfig())
+        parallel = RealtimeFeatureExtractor(RealtimeConfig(parallel_bands=True))
+
+        audio = np.random.default_rng(1).standard_normal((1024, 1)).astype(np.float32)
+
+        np.testing.assert_allclose(
+            serial.process(audio)['spectrum'],
+            parallel.process(audio)['spectrum'],
+            atol=1e-6,
+        )
+
 
 # =============================================================================
 # RealtimeConfig Tests
@@ -265,6 +335,34 @@ class TestRealtimeIntegration:
         assert abs(features1['rms'] - features2['rms']) < 0.1
 
 
+# =============================================================================
+# RealtimeVisualizer Tests
+# =============================================================================
+
+class TestRealtimeVisualizer:
+    """Tests für RealtimeVisualizer (ohne Audio-Capture)."""
+
+    def test_update_features_in_place(self):
+        """Test dass Feature-Updates die vorhandenen Arrays wiederverwenden."""
+        from src.realtime import RealtimeVisualizer
+
+        rt_viz = RealtimeVisualizer("spectrum_bars")
+        rt_viz._visualizer = Mock(spec=[])
+        rt_viz._visualizer.features = rt_viz._dummy_audio_features
+        rms_before = rt_viz._dummy_audio_features.rms
+
+        rt_viz._update_visualizer_features(
+            {"rms": 0.5, "beat": True, "centroid": 0.25, "spectrum": np.zeros(64)}
+        )
+
+        features = rt_viz._visualizer.features
+        assert features.rms is rms_before
+        assert np.allclose(features.rms, 0.5)
+        assert features.onset[0] == 1.0
+        assert np.all(features.onset[1:] == 0.0)
+        assert np.allclose(features.spectral_centroid, 0.25)
+
+
 # =============================================================================
 # Error Handling Tests
 # =============================================================================